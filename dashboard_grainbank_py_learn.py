@@ -3,11 +3,15 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import os
+import re
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import numpy as np
+from collections import Counter
 
 # --- 1. 페이지 설정 및 테마 ---
 st.set_page_config(
@@ -18,7 +22,7 @@ st.set_page_config(
 )
 
 # 커스텀 CSS (프리미엄 농부/바이오 느낌)
-st.markdown("""
+CUSTOM_CSS = """
     <style>
     :root {
         --primary-color: #2E7D32;
@@ -50,11 +54,19 @@ st.markdown("""
         padding: 12px 20px;
     }
     .stTabs [aria-selected="true"] { 
-        color: #2E7D32 !format !important; 
+        color: #2E7D32 !important; 
         border-bottom: 3px solid #2E7D32 !important; 
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def inject_css():
+    """ 커스텀 CSS 주입 (캐시된 요소 재생으로 재실행마다 스타일 문자열 재생성 방지) """
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+    return True
+
+inject_css()
 
 # --- 2. 인증 및 환경 설정 ---
 def init_env():
@@ -75,13 +87,38 @@ CLIENT_ID = os.getenv('NAVER_CLIENT_ID')
 CLIENT_SECRET = os.getenv('NAVER_CLIENT_SECRET')
 HEADERS = {
     "X-Naver-Client-Id": CLIENT_ID,
-    "X-Naver-Client-Secret": CLIENT_SECRET,
-    "Content-Type": "application/json"
+    "X-Naver-Client-Secret": CLIENT_SECRET
 }
+# API 응답 대기 상한(초) - 지연 요청이 페이지 로딩 전체를 붙잡지 않도록 제한
+REQUEST_TIMEOUT = 5
+
+# 검색 결과의 강조 태그(<b>, </b>) 제거용 정규식
+BOLD_RE = re.compile(r'</?b>')
+
+@st.cache_resource
+def naver_session():
+    """ 네이버 API 공용 세션 (재실행/사용자 간 TCP·TLS 커넥션 재사용, 일시 오류 재시도) """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        # 데이터랩 검색(POST)도 조회성 요청이므로 재시도 대상에 포함
+        # 재시도 후에도 실패하면 예외 대신 마지막 응답을 반환하여 raise_for_status로 처리
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504],
+                          allowed_methods=frozenset({"GET", "POST"}), raise_on_status=False),
+    )
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+    return session
 
 # --- 3. 데이터 엔진 (Data Engine) ---
-@st.cache_data(ttl=3600)
-def get_datalab_trend(keywords, start_date, end_date):
+# 디스크 캐시(persist="disk")는 ttl을 지원하지 않으므로 시간 단위 버킷을 캐시 키에 포함하여 1시간 주기로 갱신
+def get_cache_hour():
+    """ 캐시 키용 현재 시간 버킷 (YYYYMMDDHH) """
+    return datetime.now().strftime('%Y%m%d%H')
+
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
+def get_datalab_trend(keywords, start_date, end_date, cache_hour):
     """ 데이터랩 키워드 검색 트렌드 """
     if not CLIENT_ID or not CLIENT_SECRET: return None
     url = "https://openapi.naver.com/v1/datalab/search"
@@ -91,19 +128,46 @@ def get_datalab_trend(keywords, start_date, end_date):
         "timeUnit": "date",
         "keywordGroups": [{"groupName": k, "keywords": [k]} for k in keywords]
     }
-    res = requests.post(url, headers=HEADERS, data=json.dumps(body))
-    if res.status_code == 200:
-        results = res.json()['results']
-        combined = []
-        for r in results:
-            df = pd.DataFrame(r['data'])
-            df['keyword'] = r['title']
-            combined.append(df)
-        return pd.concat(combined) if combined else None
-    return None
-
-@st.cache_data(ttl=3600)
-def get_shopping_data(keyword, total_display=100):
+    res = naver_session().post(url, json=body, timeout=REQUEST_TIMEOUT)
+    # 실패 응답은 예외로 처리하여 디스크 캐시에 남지 않도록 함
+    res.raise_for_status()
+    results = res.json()['results']
+    combined = []
+    for r in results:
+        df = pd.DataFrame(r['data'])
+        df['keyword'] = r['title']
+        combined.append(df)
+    return pd.concat(combined, ignore_index=True) if combined else None
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def fetch_shopping_page(keyword, start, cache_hour):
+    """ 쇼핑 검색 단일 페이지(100개) 조회 - 분석 상품 수 변경 시 기존 페이지 재사용 """
+    url = f"https://openapi.naver.com/v1/search/shop.json?query={keyword}&display=100&start={start}&sort=sim"
+    res = naver_session().get(url, timeout=REQUEST_TIMEOUT)
+    res.raise_for_status()
+    return res.json()['items']
+
+# 쇼핑 분석에 사용하는 API 필드 (title/lprice/hprice는 적재 시 별도 변환)
+SHOP_TEXT_FIELDS = ('link', 'mallName', 'productType', 'brand', 'category1', 'category2', 'category3', 'category4')
+
+def to_int(value):
+    """ 가격 문자열을 정수로 변환 (빈 값/비정상 값은 NaN) """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def simulate_market_extras(n):
+    """ 배송비/할인율 시뮬레이션 값 (상품 수 n에만 의존하므로 n별 1회 생성) """
+    rng = np.random.default_rng(42)
+    return {
+        'has_delivery_fee': rng.choice(np.array(["유료", "무료"]), size=n, p=[0.7, 0.3]),
+        'discount_rate': rng.integers(0, 45, size=n),
+    }
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_shopping_data(keyword, total_display, cache_hour):
     """ 
     쇼핑 검색 상품 상세 데이터 (페이징 지원)
     ※ 참고: 네이버 검색 API는 옵션가/실제배송비를 직접 제공하지 않습니다. 
@@ -112,53 +176,192 @@ def get_shopping_data(keyword, total_display=100):
     if not CLIENT_ID or not CLIENT_SECRET: return None
     
     all_items = []
-    # 네이버 API는 한 번에 최대 100개까지 요청 가능하므로 반복 호출
-    for start in range(1, total_display + 1, 100):
-        url = f"https://openapi.naver.com/v1/search/shop.json?query={keyword}&display=100&start={start}&sort=sim"
-        res = requests.get(url, headers=HEADERS)
-        if res.status_code == 200:
-            all_items.extend(res.json()['items'])
-        else:
-            break
+    # 네이버 API는 한 번에 최대 100개까지 요청 가능하므로 페이지를 동시에 요청 (I/O 대기 병렬화)
+    starts = list(range(1, total_display + 1, 100))
+    with ThreadPoolExecutor(max_workers=len(starts)) as ex:
+        pages = ex.map(lambda start: fetch_shopping_page(keyword, start, cache_hour), starts)
+        fetched = 0
+        try:
+            for items in pages:
+                all_items.extend(items)
+                fetched += 1
+        except requests.RequestException:
+            # 첫 페이지 실패만 전파하고, 이후 페이지 실패 시 이미 받은 페이지까지만 사용 (순차 호출 시와 동일)
+            if fetched == 0:
+                raise
             
     if not all_items: return None
     
-    df = pd.DataFrame(all_items)
-    
-    # 데이터 전처리 및 정제
-    df['lprice'] = pd.to_numeric(df['lprice'], errors='coerce')
-    df['hprice'] = pd.to_numeric(df['hprice'], errors='coerce')
-    df['title'] = df['title'].str.replace('<b>', '', regex=False).str.replace('</b>', '', regex=False)
+    # 데이터 전처리 및 정제: JSON 레코드를 1회 순회하며 컬럼 리스트로 적재 (태그 제거/가격 정수 변환 동시 수행)
+    cols = {field: [] for field in ('title', 'lprice', 'hprice', *SHOP_TEXT_FIELDS)}
+    for item in all_items:
+        cols['title'].append(BOLD_RE.sub('', item.get('title', '')))
+        cols['lprice'].append(to_int(item.get('lprice')))
+        cols['hprice'].append(to_int(item.get('hprice')))
+        for field in SHOP_TEXT_FIELDS:
+            cols[field].append(item.get(field, ''))
+    df = pd.DataFrame(cols)
     
     # [데이터 사이언스 관점] 파생 변수 생성 및 시뮬레이션
     # API 한계 보완: 네이버 API는 상세 옵션가와 배송비를 필드로 제공하지 않으므로 패턴 기반 시뮬레이션 수행
-    np.random.seed(42)
-    df['p_type'] = df['productType'].apply(lambda x: "광고/카탈로그" if x in ['2','3'] else "일반상품")
-    df['has_delivery_fee'] = np.random.choice(["유료", "무료"], size=len(df), p=[0.7, 0.3])
-    df['delivery_fee_amount'] = df['has_delivery_fee'].apply(lambda x: 3000 if x == "유료" else 0)
+    sim = simulate_market_extras(len(df))
+    df['p_type'] = np.where(df['productType'].isin(['2', '3']), "광고/카탈로그", "일반상품")
+    df['has_delivery_fee'] = sim['has_delivery_fee']
+    df['delivery_fee_amount'] = np.where(df['has_delivery_fee'].eq("유료"), 3000, 0)
     
     # 대표가 대비 옵션가 변동율 시뮬레이션 (보통 -10% ~ +50% 수준)
-    df['option_price_range'] = df['lprice'].apply(lambda x: f"{int(x*0.9):,} ~ {int(x*1.5):,}")
+    lprice = df['lprice'].to_numpy()
+    option_lo = (lprice * 0.9).astype(np.int64)
+    option_hi = (lprice * 1.5).astype(np.int64)
+    df['option_price_range'] = [f"{lo:,} ~ {hi:,}" for lo, hi in zip(option_lo, option_hi)]
     
     # 할인율 및 판매가 (마케팅 지표용)
-    df['discount_rate'] = np.random.randint(0, 45, size=len(df))
+    df['discount_rate'] = sim['discount_rate']
     df['original_price'] = (df['lprice'] / (1 - df['discount_rate']/100)).astype(int)
     
     return df
 
-@st.cache_data(ttl=3600)
-def get_blog_data(keyword):
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
+def get_blog_data(keyword, cache_hour):
     """ 블로그 검색 및 마케팅 지수 """
     if not CLIENT_ID or not CLIENT_SECRET: return None
     url = f"https://openapi.naver.com/v1/search/blog.json?query={keyword}&display=100"
-    res = requests.get(url, headers=HEADERS)
-    if res.status_code == 200:
-        df = pd.DataFrame(res.json()['items'])
-        df['title'] = df['title'].str.replace('<b>', '', regex=False).str.replace('</b>', '', regex=False)
-        df['description'] = df['description'].str.replace('<b>', '', regex=False).str.replace('</b>', '', regex=False)
-        df['postdate'] = pd.to_datetime(df['postdate'], format='%Y%m%d', errors='coerce')
-        return df
-    return None
+    res = naver_session().get(url, timeout=REQUEST_TIMEOUT)
+    res.raise_for_status()
+    df = pd.DataFrame(res.json()['items'])
+    df['title'] = [BOLD_RE.sub('', t) for t in df['title']]
+    df['description'] = [BOLD_RE.sub('', t) for t in df['description']]
+    df['postdate'] = pd.to_datetime(df['postdate'], format='%Y%m%d', errors='coerce')
+    return df
+
+@st.cache_resource
+def api_cache_state():
+    """ 프로세스 내 디스크 캐시 관리 상태 (마지막으로 확인한 시간 버킷) """
+    return {'hour': None}
+
+def prune_api_cache(cache_hour):
+    """ 
+    시간 버킷이 바뀌면 이전 버킷의 디스크 캐시 파일 삭제 (이전 키는 더 이상 조회되지 않음)
+    프로세스 시작 직후에는 현재 버킷의 디스크 캐시를 재사용하기 위해 삭제하지 않음
+    """
+    state = api_cache_state()
+    if state['hour'] is not None and state['hour'] != cache_hour:
+        get_datalab_trend.clear()
+        fetch_shopping_page.clear()
+        get_blog_data.clear()
+    state['hour'] = cache_hour
+
+# 2글자 이상 토큰 추출용 정규식
+TOKEN_RE = re.compile(r'\S{2,}')
+
+# 블로그 키워드 분석용 불용어 (간이 버전, 집합 조회로 O(1) 판별)
+STOPWORDS = frozenset(["있는", "위한", "추천", "대한", "및", "방법", "하는", "통해", "정보", "관련", "오늘", "진짜", "후기", "소개"])
+
+@st.cache_data(show_spinner=False)
+def get_top_words(titles, descriptions, top_n=20):
+    """ 블로그 제목/설명 빈출 키워드 TOP N (입력 튜플 기준 캐시) """
+    # 중간 단어 리스트/Series 없이 정규식 토큰 이터레이터를 Counter에 바로 공급
+    counter = Counter(
+        m.group()
+        for pair in zip(titles, descriptions)
+        for text in pair
+        for m in TOKEN_RE.finditer(text)
+        if m.group() not in STOPWORDS
+    )
+    return pd.DataFrame(counter.most_common(top_n), columns=['키워드', '빈도'])
+
+@st.cache_data(show_spinner=False)
+def get_shop_kpis(keyword, total_display, cache_hour):
+    """ 
+    쇼핑 KPI 및 통계 지표 일괄 계산 (탭 전환/위젯 조작 시 재계산 없이 재사용)
+    DataFrame 해싱 비용을 피하기 위해 데이터를 식별하는 조회 조건으로 캐시하고, 프레임은 캐시된 조회 함수에서 읽음
+    """
+    df_shop = get_shopping_data(keyword, total_display, cache_hour)
+    prices = df_shop['lprice'].dropna().to_numpy(dtype=float)
+    n_price = len(prices)
+    # 가격 왜도 - numpy 모멘트 계산 (pandas skew와 동일한 표본 보정 적용)
+    dev = prices - prices.mean()
+    m2 = (dev * dev).mean()
+    m3 = (dev * dev * dev).mean()
+    price_skew = m3 / (m2 ** 1.5 + 1e-12) * np.sqrt(n_price * (n_price - 1)) / (n_price - 2) if n_price > 2 else 0.0
+    # 브랜드 집중도(HHI) - 브랜드 빈도 배열에서 점유율 제곱합 계산
+    _, brand_counts = np.unique(df_shop['brand'].dropna().to_numpy(), return_counts=True)
+    brand_shares = brand_counts / len(df_shop)
+    return {
+        'mean_price': int(prices.mean()),
+        'max_price': int(prices.max()),
+        'mean_discount': int(df_shop['discount_rate'].mean()),
+        'mall_count': df_shop['mallName'].nunique(),
+        'n_products': len(df_shop),
+        'price_skew': float(price_skew),
+        'hhi_index': float((brand_shares * brand_shares).sum()) * 10000,
+        'ad_ratio': float(df_shop['p_type'].eq('광고/카탈로그').mean()) * 100,
+    }
+
+@st.cache_data(show_spinner=False)
+def get_blog_kpis(keyword, cache_hour):
+    """ 블로그 KPI 일괄 계산 (쇼핑 KPI와 동일하게 조회 조건으로 캐시) """
+    df_blog = get_blog_data(keyword, cache_hour)
+    return {
+        'n_posts': len(df_blog),
+        'blogger_count': df_blog['bloggername'].nunique(),
+        'latest_post': df_blog['postdate'].max().strftime('%Y-%m-%d'),
+    }
+
+def top_k_counts(series, k):
+    """ 빈도 상위 k개 값 (value_counts().head(k) 대체 - 전체 정렬 없이 선택, 동률은 첫 등장 순서 유지) """
+    codes, uniques = pd.factorize(series)
+    cnts = np.bincount(codes[codes >= 0])
+    if len(cnts) <= k:
+        idx = np.argsort(-cnts, kind='stable')
+    else:
+        # k번째 빈도를 기준으로 초과 값은 모두, 동률 값은 첫 등장 순서대로 남은 자리만큼 선택
+        kth = np.partition(cnts, len(cnts) - k)[len(cnts) - k]
+        above = np.flatnonzero(cnts > kth)
+        ties = np.flatnonzero(cnts == kth)[:k - len(above)]
+        part = np.sort(np.concatenate([above, ties]))
+        idx = part[np.argsort(-cnts[part], kind='stable')]
+    return pd.Series(cnts[idx], index=uniques[idx])
+
+# 트렌드 차트에 전달할 키워드별 최대 포인트 수
+TREND_MAX_POINTS = 400
+
+def lttb_indices(x, y, n_out):
+    """ LTTB(Largest-Triangle-Three-Buckets) 다운샘플링 - 선택된 포인트의 인덱스 반환 """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    # 첫/마지막 포인트는 고정하고 나머지 구간을 n_out-2개 버킷으로 분할
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        # 다음 버킷의 평균점 (마지막 버킷은 끝점 사용)
+        if i + 2 < len(edges):
+            avg_x = x[hi:edges[i + 2]].mean()
+            avg_y = y[hi:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        # 이전 선택점-후보점-다음 평균점이 이루는 삼각형 넓이가 최대인 후보 선택
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
+def downsample_trend(df_trend, n_out=TREND_MAX_POINTS):
+    """ 키워드별 트렌드를 LTTB로 n_out 포인트 이하로 축소 (조회 기간과 무관하게 렌더링 비용 고정) """
+    if df_trend.groupby('keyword').size().max() <= n_out:
+        return df_trend
+    # 기간 기준 안정 정렬 1회 후 키워드 등장 순서(차트 색상 순서)를 유지하며 그룹별 축소
+    df_sorted = df_trend.sort_values('period', kind='stable')
+    parts = []
+    for _, g in df_sorted.groupby('keyword', sort=False):
+        x = pd.to_datetime(g['period']).to_numpy().astype(np.int64).astype(float)
+        y = g['ratio'].to_numpy(dtype=float)
+        parts.append(g.iloc[lttb_indices(x, y, n_out)])
+    return pd.concat(parts, ignore_index=True)
 
 # --- 4. 메인 어플리케이션 레이아웃 ---
 def main():
@@ -189,9 +392,15 @@ def main():
 
     # 데이터 로드
     with st.spinner('🚀 대규모 시장 데이터를 정밀 분석 중입니다...'):
-        df_trend = get_datalab_trend(comparison_keywords, date_range[0].strftime("%Y-%m-%d"), date_range[1].strftime("%Y-%m-%d"))
-        df_shop = get_shopping_data(main_keyword, analyze_count)
-        df_blog = get_blog_data(main_keyword)
+        cache_hour = get_cache_hour()
+        prune_api_cache(cache_hour)
+        try:
+            df_trend = get_datalab_trend(tuple(comparison_keywords), date_range[0].strftime("%Y-%m-%d"), date_range[1].strftime("%Y-%m-%d"), cache_hour)
+            df_shop = get_shopping_data(main_keyword, analyze_count, cache_hour)
+            df_blog = get_blog_data(main_keyword, cache_hour)
+        except requests.RequestException:
+            # 실패 응답/타임아웃/연결 오류는 캐시되지 않으므로 다음 실행 시 재요청
+            df_trend = df_shop = df_blog = None
 
     if df_trend is None or df_shop is None or df_blog is None:
         st.error("데이터를 불러오지 못했습니다. 키워드나 API 설정을 확인해 주세요.")
@@ -204,8 +413,8 @@ def main():
     with tab1:
         st.subheader("📊 키워드 관심도 및 시장 생애주기")
         
-        # 그래프 1: 트렌드 라인
-        fig_trend = px.line(df_trend, x='period', y='ratio', color='keyword',
+        # 그래프 1: 트렌드 라인 (긴 기간 조회 시 LTTB 다운샘플링)
+        fig_trend = px.line(downsample_trend(df_trend), x='period', y='ratio', color='keyword',
                             title="일자별 검색 활동 추이 (Search Volume Index)",
                             template="plotly_white", line_shape='spline',
                             color_discrete_sequence=px.colors.qualitative.Dark2)
@@ -260,23 +469,25 @@ def main():
     with tab2:
         st.subheader(f"🛒 '{main_keyword}' 마켓 디테일 및 가격 전략")
         
+        # 쇼핑 KPI는 캐시된 함수에서 1회 계산하여 Tab 2/Tab 4에서 공유
+        shop_kpis = get_shop_kpis(main_keyword, analyze_count, cache_hour)
+        
         # [신규 추가] 주요 활성 판매처 대시보드 화면 요소를 최상단에 배치
-        mall_count = df_shop['mallName'].nunique()
-        st.metric("활성 판매처", f"{mall_count}개")
+        st.metric("활성 판매처", f"{shop_kpis['mall_count']}개")
         
         # KPI 섹션 (기존 지표 유지하면서 레이아웃 정리)
         k1, k2, k3, k4 = st.columns(4)
-        k1.metric("최저가 평균", f"{int(df_shop['lprice'].mean()):,}원")
-        k2.metric("시장 최고가", f"{int(df_shop['lprice'].max()):,}원")
-        k3.metric("평균 할인율", f"{int(df_shop['discount_rate'].mean())}%")
-        k4.metric("분석 상품 수", f"{len(df_shop)}개")
+        k1.metric("최저가 평균", f"{shop_kpis['mean_price']:,}원")
+        k2.metric("시장 최고가", f"{shop_kpis['max_price']:,}원")
+        k3.metric("평균 할인율", f"{shop_kpis['mean_discount']}%")
+        k4.metric("분석 상품 수", f"{shop_kpis['n_products']}개")
         
         st.divider()
         
         col_s1, col_s2 = st.columns([1, 1])
         with col_s1:
             # 그래프 4: 몰 점유율 (이미지 1 스타일 반영 - 다크 그린 계열)
-            mall_share = df_shop['mallName'].value_counts().head(10)
+            mall_share = top_k_counts(df_shop['mallName'], 10)
             fig_mall = px.pie(values=mall_share.values, names=mall_share.index, hole=0.5,
                               title="주요 판매 쇼핑몰 (Top 10)",
                               color_discrete_sequence=px.colors.sequential.Greens_r)
@@ -295,7 +506,7 @@ def main():
         # [신규 추가] 실시간 상위 노출 상품 리스트 (이미지 2 스타일 반영)
         st.subheader("🛒 실시간 상위 노출 상품 리스트")
         # 데이터프레임 가공: 이미지 2의 컬럼 구성 반영
-        top_products = df_shop[['title', 'lprice', 'mallName', 'category1', 'link']].head(50).copy()
+        top_products = df_shop[['title', 'lprice', 'mallName', 'category1', 'link']].head(50)
         st.dataframe(top_products, use_container_width=True)
         
         st.divider()
@@ -306,17 +517,15 @@ def main():
             st.markdown("##### 💵 가격 티어별 시장 분포")
             bins = [0, 10000, 30000, 50000, 100000, 1000000]
             labels = ['1만 이하', '1~3만', '3~5만', '5~10만', '10만 이상']
-            # Categorical 데이터를 안전하게 처리하기 위해 변환
-            df_shop['price_tier'] = pd.cut(df_shop['lprice'], bins=bins, labels=labels).astype(str)
+            df_shop['price_tier'] = pd.cut(df_shop['lprice'], bins=bins, labels=labels)
             tier_stats = df_shop.groupby('price_tier', observed=True)['lprice'].count().reset_index(name='상품 수')
             st.table(tier_stats)
             
         with col_s4:
-            # 그래프 5: 가격 구간별 비중
-            # pd.cut 결과인 Interval 객체는 JSON 직렬화가 안 되므로 문자열로 변환
-            df_shop['price_range'] = pd.cut(df_shop['lprice'], bins=5, precision=0).astype(str)
-            range_chart = df_shop['price_range'].value_counts().reset_index()
-            range_chart.columns = ['가격구간', '개수']
+            # 그래프 5: 가격 구간별 비중 (등간격 5구간은 ndarray에 대해 np.histogram으로 직접 집계)
+            counts, edges = np.histogram(df_shop['lprice'].dropna().to_numpy(), bins=5)
+            range_labels = [f"{int(edges[i]):,}-{int(edges[i + 1]):,}" for i in range(len(counts))]
+            range_chart = pd.DataFrame({'가격구간': range_labels, '개수': counts})
             fig_range = px.bar(range_chart, x='가격구간', y='개수', title="주요 가격 티어 구간 분석",
                                color='개수', color_continuous_scale="Greens")
             st.plotly_chart(fig_range, use_container_width=True)
@@ -325,17 +534,23 @@ def main():
         st.subheader("📦 상세 마켓 데이터 분석 그리드")
         st.caption("※ 옵션가 및 배송비는 Naver API 제약으로 인해 패턴 시뮬레이션 데이터가 포함되어 있습니다.")
         
-        # 상세 데이터 그리드 구성
-        grid_df = df_shop.copy()
-        grid_df['링크'] = grid_df['link']
+        # 상세 데이터 그리드 구성 (표시할 상위 50개 행/필요 컬럼만 선택, 전체 프레임 복사 없음)
+        grid_src = df_shop.head(50)
         # 모든 분류 통합
-        grid_df['전체분류'] = grid_df['category1'] + " > " + grid_df['category2'] + " > " + grid_df['category3'] + " > " + grid_df['category4']
+        cats = grid_src[['category1', 'category2', 'category3', 'category4']].to_numpy(dtype=str)
+        final_grid = pd.DataFrame({
+            '상품명': grid_src['title'],
+            '노출유형': grid_src['p_type'],
+            '대표최저가': grid_src['lprice'],
+            '상세옵션가(추정)': grid_src['option_price_range'],
+            '배송비여부': grid_src['has_delivery_fee'],
+            '배송비금액': grid_src['delivery_fee_amount'],
+            '판매처': grid_src['mallName'],
+            '카테고리전체': [" > ".join(row) for row in cats],
+            '상품링크': grid_src['link'],
+        })
         
-        cols_to_show = ['title', 'p_type', 'lprice', 'option_price_range', 'has_delivery_fee', 'delivery_fee_amount', 'mallName', '전체분류', 'link']
-        final_grid = grid_df[cols_to_show]
-        final_grid.columns = ['상품명', '노출유형', '대표최저가', '상세옵션가(추정)', '배송비여부', '배송비금액', '판매처', '카테고리전체', '상품링크']
-        
-        st.dataframe(final_grid.head(50), use_container_width=True)
+        st.dataframe(final_grid, use_container_width=True)
 
         st.divider()
         st.subheader("🏢 카테고리별 마켓 요약")
@@ -355,35 +570,41 @@ def main():
         
         # 블로그 통계 KPI
         b1, b2, b3 = st.columns(3)
-        b1.metric("총 분석 포스팅", f"{len(df_blog)}건")
-        b2.metric("주요 활동 블로거", f"{df_blog['bloggername'].nunique()}명")
-        b3.metric("최근 포스팅 일자", f"{df_blog['postdate'].max().strftime('%Y-%m-%d')}")
+        blog_kpis = get_blog_kpis(main_keyword, cache_hour)
+        b1.metric("총 분석 포스팅", f"{blog_kpis['n_posts']}건")
+        b2.metric("주요 활동 블로거", f"{blog_kpis['blogger_count']}명")
+        b3.metric("최근 포스팅 일자", blog_kpis['latest_post'])
 
         col_b1, col_b2 = st.columns(2)
         with col_b1:
-            # 그래프 6: 포스팅 시계열 분포
-            blog_ts = df_blog.groupby('postdate', observed=True).size().reset_index(name='count')
+            # 그래프 6: 포스팅 시계열 분포 (일자 서수에 대한 bincount로 일별 게시량 집계)
+            post_days = df_blog['postdate'].dropna().to_numpy().astype('datetime64[D]').astype(np.int64)
+            if len(post_days):
+                day_origin = post_days.min()
+                day_counts = np.bincount(post_days - day_origin)
+                blog_ts = pd.DataFrame({
+                    'postdate': pd.to_datetime(day_origin + np.arange(len(day_counts)), unit='D'),
+                    'count': day_counts,
+                })
+                blog_ts = blog_ts[blog_ts['count'] > 0]
+            else:
+                blog_ts = pd.DataFrame({'postdate': pd.to_datetime([]), 'count': []})
             fig_blog_ts = px.area(blog_ts, x='postdate', y='count', title="바이럴 활동 시계열 추이",
                                   color_discrete_sequence=['#FFA000'])
             st.plotly_chart(fig_blog_ts, use_container_width=True)
         with col_b2:
-            # 그래프 7: 게시글 제목 길이 분포
-            df_blog['title_len'] = df_blog['title'].str.len()
-            fig_len = px.box(df_blog, y='title_len', title="게시글 제목 구체성 분석 (길이 분포)",
-                             color_discrete_sequence=['#FFD54F'])
+            # 그래프 7: 게시글 제목 길이 분포 (제목 길이를 int32 배열로 1회 계산 후 재사용)
+            title_lens = np.fromiter((len(t) for t in df_blog['title']), dtype=np.int32, count=len(df_blog))
+            fig_len = px.box(y=title_lens, title="게시글 제목 구체성 분석 (길이 분포)",
+                             labels={'y': 'title_len'}, color_discrete_sequence=['#FFD54F'])
             st.plotly_chart(fig_len, use_container_width=True)
+            len_p25, len_p50, len_p75 = np.percentile(title_lens, [25, 50, 75])
+            st.caption(f"제목 길이 중앙값 {len_p50:.0f}자 (Q1 {len_p25:.0f}자 ~ Q3 {len_p75:.0f}자)")
 
         st.divider()
         st.subheader("🌋 소셜 핵심 키워드 및 어구 분석")
-        # 블로그 제목/설명에서 핵심 키워드 추출 로직
-        all_text = " ".join(df_blog['title'] + " " + df_blog['description'])
-        # 불용어 처리 (간이 버전)
-        stopwords = ["있는", "위한", "추천", "대한", "및", "방법", "하는", "통해", "정보", "관련", "오늘", "진짜", "후기", "소개"]
-        
-        # 단어 정제 및 빈도 계산
-        words = [w for w in all_text.split() if len(w) > 1 and w not in stopwords]
-        word_freq = pd.Series(words).value_counts().head(20).reset_index()
-        word_freq.columns = ['키워드', '빈도']
+        # 블로그 제목/설명에서 핵심 키워드 추출 (불용어 제외 빈도 계산, 재실행 시 캐시 사용)
+        word_freq = get_top_words(tuple(df_blog['title']), tuple(df_blog['description']))
         
         w_c1, w_c2 = st.columns([1, 1])
         with w_c1:
@@ -406,7 +627,7 @@ def main():
 
         st.divider()
         st.subheader("🌟 활발한 정보 공유 블로거 TOP 12")
-        blogger_stats = df_blog['bloggername'].value_counts().head(12).reset_index()
+        blogger_stats = top_k_counts(df_blog['bloggername'], 12).reset_index()
         blogger_stats.columns = ['블로거명', '게시글 점유 수']
         
         fig_blogger = px.bar(blogger_stats, x='게시글 점유 수', y='블로거명', orientation='h',
@@ -429,12 +650,15 @@ def main():
             fig_corr = px.scatter(df_shop, x='lprice', y='discount_rate', size='original_price',
                                   color='p_type', hover_name='title',
                                   title="가격 탄력성 및 할인 전략 상관도",
-                                  trendline="ols", trendline_color_override="red")
+                                  trendline="ols", trendline_color_override="red",
+                                  render_mode='webgl')
             st.plotly_chart(fig_corr, use_container_width=True)
         with ed2:
             # 그래프 9: 브랜드별 가격 박스플롯 (시장 포지셔닝 분석)
-            top_brands = df_shop['brand'].value_counts().head(10).index
-            df_top_brands = df_shop[df_shop['brand'].isin(top_brands)]
+            # 상위 브랜드 집합으로 마스킹 후 차트에 필요한 두 컬럼만 전달
+            top_brands = set(top_k_counts(df_shop['brand'], 10).index)
+            brand_mask = np.fromiter((b in top_brands for b in df_shop['brand']), dtype=bool, count=len(df_shop))
+            df_top_brands = df_shop.loc[brand_mask, ['brand', 'lprice']]
             fig_box = px.box(df_top_brands, x='brand', y='lprice', color='brand',
                              title="상위 브랜드별 가격 포지셔닝 분석 (Price Range Per Brand)")
             st.plotly_chart(fig_box, use_container_width=True)
@@ -444,17 +668,16 @@ def main():
         st.subheader("🔬 통계적 마켓 인사이트")
         
         # 1. 가격 왜도(Skewness) 분석
-        price_skew = df_shop['lprice'].skew()
+        price_skew = shop_kpis['price_skew']
         skew_msg = "오른쪽으로 긴 꼬리(고가 상품군 존재)" if price_skew > 0 else "왼쪽으로 긴 꼬리(저가 위주 형성)"
         
         # 2. 브랜드 지배력 분석 (HHI 지수 시뮬레이션)
-        brand_shares = (df_shop['brand'].value_counts() / len(df_shop)) ** 2
-        hhi_index = brand_shares.sum() * 10000
+        hhi_index = shop_kpis['hhi_index']
         
         c_ds1, c_ds2, c_ds3 = st.columns(3)
         c_ds1.metric("가격 분포 왜도", f"{price_skew:.2f}", help=f"지표 해석: {skew_msg}")
         c_ds2.metric("브랜드 집중도 (HHI)", f"{int(hhi_index)}", help="1500 미만: 경쟁적, 2500 이상: 독과점")
-        c_ds3.metric("광고 상품 비중", f"{len(df_shop[df_shop['p_type'] == '광고/카탈로그'])/len(df_shop)*100:.1f}%")
+        c_ds3.metric("광고 상품 비중", f"{shop_kpis['ad_ratio']:.1f}%")
 
         st.info(f"""
         **🧪 전문 분석 결과 요약**: